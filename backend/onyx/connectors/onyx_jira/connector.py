@@ -1,9 +1,18 @@
+import contextvars
+import logging
 import os
+import queue
+import threading
+import time
+from collections import deque
 from collections.abc import Iterable
-from datetime import datetime
-from datetime import timezone
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+from typing import cast
+from typing import NoReturn
 
+import orjson
 from jira import JIRA
 from jira.resources import Issue
 
@@ -27,10 +36,11 @@ from onyx.connectors.models import SlimDocument
 from onyx.connectors.models import TextSection
 from onyx.connectors.onyx_jira.utils import best_effort_basic_expert_info
 from onyx.connectors.onyx_jira.utils import best_effort_get_field_from_issue
+from onyx.connectors.onyx_jira.utils import build_jira_cache_key
 from onyx.connectors.onyx_jira.utils import build_jira_client
-from onyx.connectors.onyx_jira.utils import build_jira_url
 from onyx.connectors.onyx_jira.utils import extract_text_from_adf
 from onyx.connectors.onyx_jira.utils import get_comment_strs
+from onyx.connectors.onyx_jira.utils import get_project_keys_cached
 from onyx.indexing.indexing_heartbeat import IndexingHeartbeatInterface
 from onyx.utils.logger import setup_logger
 
@@ -39,121 +49,434 @@ logger = setup_logger()
 
 JIRA_API_VERSION = os.environ.get("JIRA_API_VERSION") or "2"
 _JIRA_SLIM_PAGE_SIZE = 500
-_JIRA_FULL_PAGE_SIZE = 50
+_JIRA_FULL_PAGE_SIZE = 100
+# Explicitly request only the fields read when building Documents, rather than
+# having Jira serialize every (custom) field of every issue
+_JIRA_FULL_FIELDS = (
+    "summary,description,labels,creator,assignee,priority,status,resolution,"
+    "updated,comment"
+)
+_JIRA_SLIM_FIELDS = "key"
+# fields whose "name" is stored as document metadata under the same key
+_JIRA_METADATA_NAME_FIELDS = ("priority", "status", "resolution")
+# number of threads used to convert fetched issues into Documents while the
+# next page is being fetched
+_JIRA_TRANSFORM_WORKERS = 8
+# max number of projects searched concurrently when indexing all projects
+_JIRA_MAX_PARALLEL_PROJECTS = 4
+_JIRA_QUEUE_POLL_SECONDS = 1.0
+
+
+def _is_cloud_deployment(jira_client: JIRA) -> bool:
+    deployment_type = getattr(jira_client, "deploymentType", None)
+    if deployment_type is None:
+        # Store it so /serverInfo is only called once per client
+        deployment_type = jira_client.server_info().get("deploymentType") or "Server"
+        jira_client.deploymentType = deployment_type
+    return deployment_type == "Cloud"
+
+
+def _paginate_jql_search_pages_cloud(
+    jira_client: JIRA,
+    jql: str,
+    max_results: int,
+    fields: str | None = None,
+) -> Iterable[list[Issue]]:
+    """Jira Cloud supports cursor based pagination via `nextPageToken`, which
+    avoids the server re-scanning / re-sorting results for every offset."""
+    if not jql:
+        raise ValueError("Jira Cloud's enhanced search does not accept an empty JQL")
+    search_url = jira_client._get_url("search/jql")
+    next_page_token: str | None = None
+    while True:
+        logger.debug(
+            "Fetching Jira issues with JQL: %s, page token: %s, max results: %d",
+            jql,
+            next_page_token,
+            max_results,
+        )
+        request_body: dict[str, Any] = {
+            "jql": jql,
+            "maxResults": max_results,
+            "fields": fields.split(",") if fields else ["*navigable"],
+        }
+        if next_page_token:
+            request_body["nextPageToken"] = next_page_token
+
+        # decode straight from the response so the raw response body isn't
+        # kept alive while this generator is suspended at the yield below
+        page = orjson.loads(
+            jira_client._session.post(search_url, json=request_body).content
+        )
 
+        yield [
+            Issue(jira_client._options, jira_client._session, raw=raw_issue)
+            for raw_issue in page.get("issues", [])
+        ]
 
-def _paginate_jql_search(
+        next_page_token = page.get("nextPageToken")
+        if not next_page_token:
+            break
+
+
+def _paginate_jql_search_pages(
     jira_client: JIRA,
     jql: str,
     max_results: int,
     fields: str | None = None,
-) -> Iterable[Issue]:
+) -> Iterable[list[Issue]]:
+    if _is_cloud_deployment(jira_client):
+        yield from _paginate_jql_search_pages_cloud(
+            jira_client=jira_client,
+            jql=jql,
+            max_results=max_results,
+            fields=fields,
+        )
+        return
+
+    # POST so that long JQL (base filter, date range, ...) travels in the
+    # request body rather than the query string, where proxies may cap its length
+    search_url = jira_client._get_url("search")
     start = 0
     while True:
         logger.debug(
-            f"Fetching Jira issues with JQL: {jql}, "
-            f"starting at {start}, max results: {max_results}"
+            "Fetching Jira issues with JQL: %s, starting at %d, max results: %d",
+            jql,
+            start,
+            max_results,
         )
-        issues = jira_client.search_issues(
-            jql_str=jql,
-            startAt=start,
-            maxResults=max_results,
-            fields=fields,
+        request_body: dict[str, Any] = {
+            "jql": jql,
+            "startAt": start,
+            "maxResults": max_results,
+            "fields": fields.split(",") if fields else ["*all"],
+        }
+
+        # see the Cloud paginator, the response isn't kept across the yield
+        page = orjson.loads(
+            jira_client._session.post(search_url, json=request_body).content
         )
+        raw_issues = page.get("issues", [])
 
-        for issue in issues:
-            if isinstance(issue, Issue):
-                yield issue
-            else:
-                raise Exception(f"Found Jira object not of type Issue: {issue}")
+        yield [
+            Issue(jira_client._options, jira_client._session, raw=raw_issue)
+            for raw_issue in raw_issues
+        ]
 
-        if len(issues) < max_results:
+        # the server may return fewer issues than requested, so advance by
+        # what was actually returned
+        start += len(raw_issues)
+        if not raw_issues or start >= page.get("total", 0):
             break
 
-        start += max_results
 
-
-def fetch_jira_issues_batch(
+def _paginate_jql_search(
     jira_client: JIRA,
     jql: str,
-    batch_size: int,
-    comment_email_blacklist: tuple[str, ...] = (),
-    labels_to_skip: set[str] | None = None,
-) -> Iterable[Document]:
-    for issue in _paginate_jql_search(
+    max_results: int,
+    fields: str | None = None,
+) -> Iterable[Issue]:
+    for page in _paginate_jql_search_pages(
         jira_client=jira_client,
         jql=jql,
-        max_results=batch_size,
+        max_results=max_results,
+        fields=fields,
     ):
-        if labels_to_skip:
-            if any(label in issue.fields.labels for label in labels_to_skip):
+        yield from page
+
+
+def _exceeds_max_ticket_size(ticket_content: str) -> bool:
+    """Checks the UTF-8 size of the ticket without encoding it when possible"""
+    # UTF-8 uses at most 4 bytes per character
+    if len(ticket_content) * 4 <= JIRA_CONNECTOR_MAX_TICKET_SIZE:
+        return False
+    if ticket_content.isascii():
+        return len(ticket_content) > JIRA_CONNECTOR_MAX_TICKET_SIZE
+    return len(ticket_content.encode("utf-8")) > JIRA_CONNECTOR_MAX_TICKET_SIZE
+
+
+def _get_raw_fields(issue: Issue) -> dict[str, Any]:
+    raw = getattr(issue, "raw", None)
+    if isinstance(raw, dict):
+        return raw.get("fields") or {}
+    return {}
+
+
+def _get_issue_field(issue: Issue, raw_fields: dict[str, Any], field: str) -> Any:
+    """Reads the field straight from the issue's raw JSON, only falling back to
+    the attribute based lookup if it's not there"""
+    if field in raw_fields:
+        return raw_fields[field]
+    return best_effort_get_field_from_issue(issue, field)
+
+
+def _get_name(value: Any) -> Any:
+    # raw JSON fields are dicts, resolved fields are jira Resources
+    if isinstance(value, dict):
+        return value.get("name")
+    return value.name
+
+
+def _build_metadata_dict(
+    issue: Issue, raw_fields: dict[str, Any]
+) -> dict[str, str | list[str]]:
+    metadata_dict: dict[str, str | list[str]] = {}
+    if raw_fields:
+        # fast path, plain dict lookups on the issue's JSON
+        for field in _JIRA_METADATA_NAME_FIELDS:
+            if (value := raw_fields.get(field)) and (name := value.get("name")):
+                metadata_dict[field] = name
+        if labels := raw_fields.get("labels"):
+            metadata_dict["label"] = labels
+        return metadata_dict
+
+    for field in _JIRA_METADATA_NAME_FIELDS:
+        if value := best_effort_get_field_from_issue(issue, field):
+            if name := _get_name(value):
+                metadata_dict[field] = name
+    if labels := best_effort_get_field_from_issue(issue, "labels"):
+        metadata_dict["label"] = labels
+    return metadata_dict
+
+
+def _issue_to_document(
+    issue: Issue,
+    base_url: str,
+    comment_email_blacklist: frozenset[str] = frozenset(),
+    labels_to_skip: frozenset[str] = frozenset(),
+) -> Document | None:
+    """Converts a Jira issue into a Document. Returns None if the issue should
+    be skipped. Must not use the Jira client, since it runs in worker threads."""
+    if labels_to_skip:
+        if not labels_to_skip.isdisjoint(issue.fields.labels):
+            if logger.isEnabledFor(logging.INFO):
                 logger.info(
-                    f"Skipping {issue.key} because it has a label to skip. Found "
-                    f"labels: {issue.fields.labels}. Labels to skip: {labels_to_skip}."
+                    "Skipping %s because it has a label to skip. Found labels: %s. "
+                    "Labels to skip: %s.",
+                    issue.key,
+                    issue.fields.labels,
+                    sorted(labels_to_skip),
                 )
-                continue
+            return None
 
-        description = (
-            issue.fields.description
-            if JIRA_API_VERSION == "2"
-            else extract_text_from_adf(issue.raw["fields"]["description"])
-        )
-        comments = get_comment_strs(
-            issue=issue,
-            comment_email_blacklist=comment_email_blacklist,
-        )
-        ticket_content = f"{description}\n" + "\n".join(
-            [f"Comment: {comment}" for comment in comments if comment]
+    description = (
+        issue.fields.description
+        if JIRA_API_VERSION == "2"
+        else extract_text_from_adf(issue.raw["fields"]["description"])
+    )
+    comments = get_comment_strs(
+        issue=issue,
+        comment_email_blacklist=comment_email_blacklist,
+    )
+    ticket_content = "\n".join(
+        [
+            description or "",
+            *(f"Comment: {comment}" for comment in comments if comment),
+        ]
+    )
+
+    # Check ticket size
+    if _exceeds_max_ticket_size(ticket_content):
+        logger.info(
+            "Skipping %s because it exceeds the maximum size of %d bytes.",
+            issue.key,
+            JIRA_CONNECTOR_MAX_TICKET_SIZE,
         )
+        return None
 
-        # Check ticket size
-        if len(ticket_content.encode("utf-8")) > JIRA_CONNECTOR_MAX_TICKET_SIZE:
-            logger.info(
-                f"Skipping {issue.key} because it exceeds the maximum size of "
-                f"{JIRA_CONNECTOR_MAX_TICKET_SIZE} bytes."
-            )
-            continue
+    page_url = f"{base_url}/browse/{issue.key}"
+
+    raw_fields = _get_raw_fields(issue)
+
+    # creator / assignee come from the raw JSON as plain dicts, which
+    # best_effort_basic_expert_info can read (it can't read jira User resources)
+    people = set()
+    try:
+        creator = _get_issue_field(issue, raw_fields, "creator")
+        if basic_expert_info := best_effort_basic_expert_info(creator):
+            people.add(basic_expert_info)
+    except Exception:
+        # Author should exist but if not, doesn't matter
+        pass
+
+    try:
+        assignee = _get_issue_field(issue, raw_fields, "assignee")
+        if basic_expert_info := best_effort_basic_expert_info(assignee):
+            people.add(basic_expert_info)
+    except Exception:
+        # Author should exist but if not, doesn't matter
+        pass
+
+    metadata_dict = _build_metadata_dict(issue, raw_fields)
+
+    # every field below is already of the declared type, so skip pydantic's
+    # per-field validation for this hot path
+    return Document.model_construct(
+        id=page_url,
+        sections=[TextSection.model_construct(link=page_url, text=ticket_content)],
+        source=DocumentSource.JIRA,
+        semantic_identifier=f"{issue.key}: {issue.fields.summary}",
+        title=f"{issue.key} {issue.fields.summary}",
+        doc_updated_at=time_str_to_utc(issue.fields.updated),
+        primary_owners=list(people) or None,
+        # TODO add secondary_owners (commenters) if needed
+        metadata=metadata_dict,
+    )
 
-        page_url = f"{jira_client.client_info()}/browse/{issue.key}"
 
-        people = set()
-        try:
-            creator = best_effort_get_field_from_issue(issue, "creator")
-            if basic_expert_info := best_effort_basic_expert_info(creator):
-                people.add(basic_expert_info)
-        except Exception:
-            # Author should exist but if not, doesn't matter
-            pass
+def fetch_jira_issues_batch(
+    jira_client: JIRA,
+    jql: str,
+    batch_size: int,
+    comment_email_blacklist: frozenset[str] = frozenset(),
+    labels_to_skip: set[str] | None = None,
+    transform_workers: int = _JIRA_TRANSFORM_WORKERS,
+) -> Iterable[Document]:
+    """comment_email_blacklist is expected to contain stripped, lowercased emails"""
+    base_url = jira_client.client_info()
+    labels_to_skip_frozen = frozenset(labels_to_skip or ())
+    # bound the number of issues being processed at once so that a slow
+    # consumer applies backpressure to the page fetching
+    max_pending = 2 * batch_size
+
+    with ThreadPoolExecutor(max_workers=transform_workers) as executor:
+        pending: deque[Future[Document | None]] = deque()
+        for page in _paginate_jql_search_pages(
+            jira_client=jira_client,
+            jql=jql,
+            max_results=batch_size,
+            fields=_JIRA_FULL_FIELDS,
+        ):
+            for issue in page:
+                # Capture the current context so that the thread gets the current tenant ID
+                current_context = contextvars.copy_context()
+                pending.append(
+                    executor.submit(
+                        current_context.run,
+                        _issue_to_document,
+                        issue=issue,
+                        base_url=base_url,
+                        comment_email_blacklist=comment_email_blacklist,
+                        labels_to_skip=labels_to_skip_frozen,
+                    )
+                )
+
+            # yield finished documents in order, blocking only once too many
+            # issues are in flight
+            while pending and (pending[0].done() or len(pending) > max_pending):
+                if doc := pending.popleft().result():
+                    yield doc
+
+        while pending:
+            if doc := pending.popleft().result():
+                yield doc
 
+
+def _fetch_jira_issues_for_projects(
+    jira_client: JIRA,
+    jqls: list[str],
+    batch_size: int,
+    comment_email_blacklist: frozenset[str] = frozenset(),
+    labels_to_skip: set[str] | None = None,
+) -> Iterable[Document]:
+    """Runs one paginated search per JQL query concurrently and yields the
+    resulting documents as they become available. Documents from different
+    queries are interleaved."""
+    if not jqls:
+        return
+
+    # resolve the deployment type up front, so the project threads don't each
+    # race to call /serverInfo on the shared client
+    _is_cloud_deployment(jira_client)
+
+    # Each project thread runs its own transform pool. Split the transform
+    # workers between them so the total thread count (and the number of
+    # concurrent users of the shared requests session) stays at
+    # num_project_threads + _JIRA_TRANSFORM_WORKERS rather than multiplying
+    num_project_threads = min(len(jqls), _JIRA_MAX_PARALLEL_PROJECTS)
+    transform_workers = max(1, _JIRA_TRANSFORM_WORKERS // num_project_threads)
+
+    # bounded so that fast projects can't buffer unboundedly ahead of the consumer
+    output: queue.Queue[Document | Exception | None] = queue.Queue(
+        maxsize=2 * batch_size
+    )
+    stop = threading.Event()
+
+    def _put(item: Document | Exception | None) -> bool:
+        while not stop.is_set():
+            try:
+                output.put(item, timeout=_JIRA_QUEUE_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _fetch(jql: str) -> None:
         try:
-            assignee = best_effort_get_field_from_issue(issue, "assignee")
-            if basic_expert_info := best_effort_basic_expert_info(assignee):
-                people.add(basic_expert_info)
-        except Exception:
-            # Author should exist but if not, doesn't matter
-            pass
-
-        metadata_dict = {}
-        if priority := best_effort_get_field_from_issue(issue, "priority"):
-            metadata_dict["priority"] = priority.name
-        if status := best_effort_get_field_from_issue(issue, "status"):
-            metadata_dict["status"] = status.name
-        if resolution := best_effort_get_field_from_issue(issue, "resolution"):
-            metadata_dict["resolution"] = resolution.name
-        if labels := best_effort_get_field_from_issue(issue, "labels"):
-            metadata_dict["label"] = labels
+            if stop.is_set():
+                return
+            for doc in fetch_jira_issues_batch(
+                jira_client=jira_client,
+                jql=jql,
+                batch_size=batch_size,
+                comment_email_blacklist=comment_email_blacklist,
+                labels_to_skip=labels_to_skip,
+                transform_workers=transform_workers,
+            ):
+                if not _put(doc):
+                    return
+        except Exception as e:
+            _put(e)
+        finally:
+            # signals that this query is exhausted
+            _put(None)
+
+    executor = ThreadPoolExecutor(max_workers=num_project_threads)
+    try:
+        for jql in jqls:
+            # Capture the current context so that the thread gets the current tenant ID
+            current_context = contextvars.copy_context()
+            executor.submit(current_context.run, _fetch, jql)
+
+        remaining = len(jqls)
+        while remaining:
+            item = output.get()
+            if item is None:
+                remaining -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        # also reached if the consumer stops early, unblock and stop the workers
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _format_jql_datetime(timestamp: SecondsSinceUnixEpoch) -> str:
+    """Formats a UTC timestamp as "%Y-%m-%d %H:%M" without going through strftime"""
+    utc = time.gmtime(timestamp)
+    return (
+        f"{utc.tm_year:04d}-{utc.tm_mon:02d}-{utc.tm_mday:02d} "
+        f"{utc.tm_hour:02d}:{utc.tm_min:02d}"
+    )
 
-        yield Document(
-            id=page_url,
-            sections=[TextSection(link=page_url, text=ticket_content)],
-            source=DocumentSource.JIRA,
-            semantic_identifier=f"{issue.key}: {issue.fields.summary}",
-            title=f"{issue.key} {issue.fields.summary}",
-            doc_updated_at=time_str_to_utc(issue.fields.updated),
-            primary_owners=list(people) or None,
-            # TODO add secondary_owners (commenters) if needed
-            metadata=metadata_dict,
-        )
+
+def _batch_documents(
+    docs: Iterable[Document], batch_size: int
+) -> GenerateDocumentsOutput:
+    # fill a preallocated list by index instead of growing it via append
+    batch: list[Document | None] = [None] * batch_size
+    num_docs = 0
+    for doc in docs:
+        batch[num_docs] = doc
+        num_docs += 1
+        if num_docs == batch_size:
+            yield cast(list[Document], batch)
+            batch = [None] * batch_size
+            num_docs = 0
+
+    yield cast(list[Document], batch[:num_docs])
 
 
 class JiraConnector(LoadConnector, PollConnector, SlimConnector):
@@ -171,14 +494,20 @@ class JiraConnector(LoadConnector, PollConnector, SlimConnector):
         self.batch_size = batch_size
         self.jira_base = jira_base_url.rstrip("/")  # Remove trailing slash if present
         self.jira_project = project_key
-        self._comment_email_blacklist = comment_email_blacklist or []
+        self._comment_email_blacklist = tuple(
+            email.strip() for email in comment_email_blacklist or []
+        )
+        self._comment_email_blacklist_set = frozenset(
+            email.lower() for email in self._comment_email_blacklist
+        )
         self.labels_to_skip = set(labels_to_skip)
 
         self._jira_client: JIRA | None = None
+        self._cache_key: str | None = None
 
     @property
     def comment_email_blacklist(self) -> tuple:
-        return tuple(email.strip() for email in self._comment_email_blacklist)
+        return self._comment_email_blacklist
 
     @property
     def jira_client(self) -> JIRA:
@@ -198,6 +527,7 @@ class JiraConnector(LoadConnector, PollConnector, SlimConnector):
             credentials=credentials,
             jira_base=self.jira_base,
         )
+        self._cache_key = build_jira_cache_key(credentials, self.jira_base)
         return None
 
     def _get_jql_query(self) -> str:
@@ -206,53 +536,74 @@ class JiraConnector(LoadConnector, PollConnector, SlimConnector):
             return f"project = {self.quoted_jira_project}"
         return ""  # Empty string means all accessible projects
 
+    def _get_per_project_jql_queries(self, use_cache: bool = False) -> list[str]:
+        """One JQL query per accessible project, used when no specific project
+        is set. Only full indexing reads the project list from the short-lived
+        cache: slim documents drive pruning, so they must see the current
+        projects or documents of newly added projects would be pruned."""
+        if use_cache and self._cache_key:
+            project_keys = get_project_keys_cached(self.jira_client, self._cache_key)
+        else:
+            project_keys = [project.key for project in self.jira_client.projects()]
+        return [f'project = "{project_key}"' for project_key in project_keys]
+
+    def _get_jql_queries(self) -> list[str]:
+        """Jira Cloud's enhanced search rejects unbounded (empty) JQL, so when no
+        project is set on Cloud, search each accessible project instead"""
+        if self.jira_project or not _is_cloud_deployment(self.jira_client):
+            return [self._get_jql_query()]
+        return self._get_per_project_jql_queries()
+
     def load_from_state(self) -> GenerateDocumentsOutput:
-        jql = self._get_jql_query()
+        if not self.jira_project:
+            # Jira scales better searching each project separately than
+            # paging through a single query over every project
+            yield from _batch_documents(
+                _fetch_jira_issues_for_projects(
+                    jira_client=self.jira_client,
+                    jqls=self._get_per_project_jql_queries(use_cache=True),
+                    batch_size=_JIRA_FULL_PAGE_SIZE,
+                    comment_email_blacklist=self._comment_email_blacklist_set,
+                    labels_to_skip=self.labels_to_skip,
+                ),
+                self.batch_size,
+            )
+            return
 
-        document_batch = []
-        for doc in fetch_jira_issues_batch(
-            jira_client=self.jira_client,
-            jql=jql,
-            batch_size=_JIRA_FULL_PAGE_SIZE,
-            comment_email_blacklist=self.comment_email_blacklist,
-            labels_to_skip=self.labels_to_skip,
-        ):
-            document_batch.append(doc)
-            if len(document_batch) >= self.batch_size:
-                yield document_batch
-                document_batch = []
+        jql = self._get_jql_query()
 
-        yield document_batch
+        yield from _batch_documents(
+            fetch_jira_issues_batch(
+                jira_client=self.jira_client,
+                jql=jql,
+                batch_size=_JIRA_FULL_PAGE_SIZE,
+                comment_email_blacklist=self._comment_email_blacklist_set,
+                labels_to_skip=self.labels_to_skip,
+            ),
+            self.batch_size,
+        )
 
     def poll_source(
         self, start: SecondsSinceUnixEpoch, end: SecondsSinceUnixEpoch
     ) -> GenerateDocumentsOutput:
-        start_date_str = datetime.fromtimestamp(start, tz=timezone.utc).strftime(
-            "%Y-%m-%d %H:%M"
-        )
-        end_date_str = datetime.fromtimestamp(end, tz=timezone.utc).strftime(
-            "%Y-%m-%d %H:%M"
-        )
+        start_date_str = _format_jql_datetime(start)
+        end_date_str = _format_jql_datetime(end)
 
         base_jql = self._get_jql_query()
         jql = (
             f"{base_jql} AND " if base_jql else ""
         ) + f"updated >= '{start_date_str}' AND updated <= '{end_date_str}'"
 
-        document_batch = []
-        for doc in fetch_jira_issues_batch(
-            jira_client=self.jira_client,
-            jql=jql,
-            batch_size=_JIRA_FULL_PAGE_SIZE,
-            comment_email_blacklist=self.comment_email_blacklist,
-            labels_to_skip=self.labels_to_skip,
-        ):
-            document_batch.append(doc)
-            if len(document_batch) >= self.batch_size:
-                yield document_batch
-                document_batch = []
-
-        yield document_batch
+        yield from _batch_documents(
+            fetch_jira_issues_batch(
+                jira_client=self.jira_client,
+                jql=jql,
+                batch_size=_JIRA_FULL_PAGE_SIZE,
+                comment_email_blacklist=self._comment_email_blacklist_set,
+                labels_to_skip=self.labels_to_skip,
+            ),
+            self.batch_size,
+        )
 
     def retrieve_all_slim_documents(
         self,
@@ -260,29 +611,53 @@ class JiraConnector(LoadConnector, PollConnector, SlimConnector):
         end: SecondsSinceUnixEpoch | None = None,
         callback: IndexingHeartbeatInterface | None = None,
     ) -> GenerateSlimDocumentOutput:
-        jql = self._get_jql_query()
+        base_url = self.jira_client.client_info()
 
         slim_doc_batch = []
-        for issue in _paginate_jql_search(
-            jira_client=self.jira_client,
-            jql=jql,
-            max_results=_JIRA_SLIM_PAGE_SIZE,
-            fields="key",
-        ):
-            issue_key = best_effort_get_field_from_issue(issue, "key")
-            id = build_jira_url(self.jira_client, issue_key)
-            slim_doc_batch.append(
-                SlimDocument(
-                    id=id,
-                    perm_sync_data=None,
+        for jql in self._get_jql_queries():
+            for issue in _paginate_jql_search(
+                jira_client=self.jira_client,
+                jql=jql,
+                max_results=_JIRA_SLIM_PAGE_SIZE,
+                fields=_JIRA_SLIM_FIELDS,
+            ):
+                # the key is a top level attribute of the issue, not one of its fields
+                slim_doc_batch.append(
+                    SlimDocument.model_construct(
+                        id=f"{base_url}/browse/{issue.key}",
+                        perm_sync_data=None,
+                    )
                 )
-            )
-            if len(slim_doc_batch) >= _JIRA_SLIM_PAGE_SIZE:
-                yield slim_doc_batch
-                slim_doc_batch = []
+                if len(slim_doc_batch) >= _JIRA_SLIM_PAGE_SIZE:
+                    yield slim_doc_batch
+                    slim_doc_batch = []
 
         yield slim_doc_batch
 
+    def _raise_validation_error(self, e: Exception, forbidden_detail: str) -> NoReturn:
+        """Maps a Jira API error raised during validation to the matching
+        connector validation exception"""
+        status_code = getattr(e, "status_code", None)
+
+        if status_code == 401:
+            raise CredentialExpiredError(
+                "Jira credential appears to be expired or invalid (HTTP 401)."
+            )
+        elif status_code == 403:
+            raise InsufficientPermissionsError(
+                f"Your Jira token does not have sufficient permissions {forbidden_detail} (HTTP 403)."
+            )
+        elif status_code == 404 and self.jira_project:
+            raise ConnectorValidationError(
+                f"Jira project not found with key: {self.jira_project}"
+            )
+        elif status_code == 429:
+            raise ConnectorValidationError(
+                "Validation failed due to Jira rate-limits being exceeded. Please try again later."
+            )
+
+        raise RuntimeError(f"Unexpected Jira error during validation: {e}")
+
     def validate_connector_settings(self) -> None:
         if self._jira_client is None:
             raise ConnectorMissingCredentialError("Jira")
@@ -292,47 +667,15 @@ class JiraConnector(LoadConnector, PollConnector, SlimConnector):
             try:
                 self.jira_client.project(self.jira_project)
             except Exception as e:
-                status_code = getattr(e, "status_code", None)
-
-                if status_code == 401:
-                    raise CredentialExpiredError(
-                        "Jira credential appears to be expired or invalid (HTTP 401)."
-                    )
-                elif status_code == 403:
-                    raise InsufficientPermissionsError(
-                        "Your Jira token does not have sufficient permissions for this project (HTTP 403)."
-                    )
-                elif status_code == 404:
-                    raise ConnectorValidationError(
-                        f"Jira project not found with key: {self.jira_project}"
-                    )
-                elif status_code == 429:
-                    raise ConnectorValidationError(
-                        "Validation failed due to Jira rate-limits being exceeded. Please try again later."
-                    )
-
-                raise RuntimeError(f"Unexpected Jira error during validation: {e}")
+                self._raise_validation_error(e, "for this project")
         else:
             # If no project specified, validate we can access the Jira API
             try:
-                # Try to list projects to validate access
-                self.jira_client.projects()
+                # Fetch the current user rather than listing every project,
+                # which can be a very large response on big instances
+                self.jira_client.myself()
             except Exception as e:
-                status_code = getattr(e, "status_code", None)
-                if status_code == 401:
-                    raise CredentialExpiredError(
-                        "Jira credential appears to be expired or invalid (HTTP 401)."
-                    )
-                elif status_code == 403:
-                    raise InsufficientPermissionsError(
-                        "Your Jira token does not have sufficient permissions to list projects (HTTP 403)."
-                    )
-                elif status_code == 429:
-                    raise ConnectorValidationError(
-                        "Validation failed due to Jira rate-limits being exceeded. Please try again later."
-                    )
-
-                raise RuntimeError(f"Unexpected Jira error during validation: {e}")
+                self._raise_validation_error(e, "to access the Jira API")
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 """Module with custom fields processing functions"""
+import hashlib
 import os
+import time
 from typing import Any
 from typing import List
 from urllib.parse import urlparse
@@ -8,6 +10,8 @@ from jira import JIRA
 from jira.resources import CustomFieldOption
 from jira.resources import Issue
 from jira.resources import User
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from onyx.connectors.models import BasicExpertInfo
 from onyx.utils.logger import setup_logger
@@ -17,6 +21,13 @@ logger = setup_logger()
 
 PROJECT_URL_PAT = "projects"
 JIRA_API_VERSION = os.environ.get("JIRA_API_VERSION") or "2"
+_JIRA_POOL_CONNECTIONS = 4
+_JIRA_POOL_MAXSIZE = 32
+
+# the accessible projects rarely change, so they are shared across connector
+# instances (one is created per task) for a short period
+_JIRA_METADATA_CACHE_TTL_SECONDS = 300
+_project_keys_cache: dict[str, tuple[float, list[str]]] = {}
 
 
 def best_effort_basic_expert_info(obj: Any) -> BasicExpertInfo | None:
@@ -52,20 +63,51 @@ def extract_text_from_adf(adf: dict | None) -> str:
     """Extracts plain text from Atlassian Document Format:
     https://developer.atlassian.com/cloud/jira/platform/apis/document/structure/
 
-    WARNING: This function is incomplete and will e.g. skip lists!
+    Walks the tree with an explicit stack so deeply nested nodes (e.g. lists,
+    tables) are included without recursion.
     """
-    texts = []
-    if adf is not None and "content" in adf:
-        for block in adf["content"]:
-            if "content" in block:
-                for item in block["content"]:
-                    if item["type"] == "text":
-                        texts.append(item["text"])
+    if adf is None:
+        return ""
+
+    texts: list[str] = []
+    stack: list[Any] = list(reversed(adf.get("content") or []))
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, dict):
+            continue
+        if node.get("type") == "text":
+            if text := node.get("text"):
+                texts.append(text)
+        if children := node.get("content"):
+            stack.extend(reversed(children))
     return " ".join(texts)
 
 
-def build_jira_url(jira_client: JIRA, issue_key: str) -> str:
-    return f"{jira_client.client_info()}/browse/{issue_key}"
+def _mount_keep_alive_adapter(jira_client: JIRA) -> None:
+    """Use a larger connection pool for this client so paginated searches
+    (including concurrent ones) reuse keep-alive connections instead of paying
+    a TCP + TLS handshake per page.
+
+    jira-python's ResilientSession only retries 429s and connection errors
+    (the latter with its own backoff), so the adapter retries transient 5xx
+    responses and leaves connection / read failures to the session."""
+    adapter = HTTPAdapter(
+        pool_connections=_JIRA_POOL_CONNECTIONS,
+        pool_maxsize=_JIRA_POOL_MAXSIZE,
+        max_retries=Retry(
+            total=3,
+            connect=0,
+            read=0,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=None,
+            backoff_factor=0.3,
+            # hand the final error response back so jira-python raises its
+            # usual JIRAError for it
+            raise_on_status=False,
+        ),
+    )
+    jira_client._session.mount("https://", adapter)
+    jira_client._session.mount("http://", adapter)
 
 
 def build_jira_client(credentials: dict[str, Any], jira_base: str) -> JIRA:
@@ -73,18 +115,51 @@ def build_jira_client(credentials: dict[str, Any], jira_base: str) -> JIRA:
     # if user provide an email we assume it's cloud
     if "jira_user_email" in credentials:
         email = credentials["jira_user_email"]
-        return JIRA(
+        jira_client = JIRA(
             basic_auth=(email, api_token),
             server=jira_base,
             options={"rest_api_version": JIRA_API_VERSION},
+            get_server_info=False,
         )
     else:
-        return JIRA(
+        jira_client = JIRA(
             token_auth=api_token,
             server=jira_base,
             options={"rest_api_version": JIRA_API_VERSION},
+            get_server_info=False,
         )
 
+    _mount_keep_alive_adapter(jira_client)
+    return jira_client
+
+
+def build_jira_cache_key(credentials: dict[str, Any], jira_base: str) -> str:
+    """Different credentials may see different projects, so cached metadata is
+    keyed by both the instance and a hash of the credential"""
+    credential_hash = hashlib.sha256(
+        credentials["jira_api_token"].encode("utf-8")
+    ).hexdigest()
+    return f"{jira_base}:{credential_hash}"
+
+
+def _get_fresh(cache: dict[str, tuple[float, Any]], cache_key: str) -> Any | None:
+    cached = cache.get(cache_key)
+    if cached is None:
+        return None
+    cached_at, value = cached
+    if time.monotonic() - cached_at > _JIRA_METADATA_CACHE_TTL_SECONDS:
+        return None
+    return value
+
+
+def get_project_keys_cached(jira_client: JIRA, cache_key: str) -> list[str]:
+    if (project_keys := _get_fresh(_project_keys_cache, cache_key)) is not None:
+        return project_keys
+
+    project_keys = [project.key for project in jira_client.projects()]
+    _project_keys_cache[cache_key] = (time.monotonic(), project_keys)
+    return project_keys
+
 
 def extract_jira_project(url: str) -> tuple[str, str]:
     parsed_url = urlparse(url)
@@ -105,8 +180,9 @@ def extract_jira_project(url: str) -> tuple[str, str]:
 
 
 def get_comment_strs(
-    issue: Issue, comment_email_blacklist: tuple[str, ...] = ()
+    issue: Issue, comment_email_blacklist: frozenset[str] = frozenset()
 ) -> list[str]:
+    """comment_email_blacklist is expected to contain stripped, lowercased emails"""
     comment_strs = []
     for comment in issue.fields.comment.comments:
         try:
@@ -117,9 +193,10 @@ def get_comment_strs(
             )
 
             if (
-                hasattr(comment, "author")
-                and hasattr(comment.author, "emailAddress")
-                and comment.author.emailAddress in comment_email_blacklist
+                comment_email_blacklist
+                and hasattr(comment, "author")
+                and (email := getattr(comment.author, "emailAddress", None))
+                and email.lower() in comment_email_blacklist
             ):
                 continue  # Skip adding comment if author's email is in blacklist
 
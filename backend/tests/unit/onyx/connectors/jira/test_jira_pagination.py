@@ -0,0 +1,228 @@
+import time
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from onyx.configs.constants import DocumentSource
+from onyx.connectors.models import Document
+from onyx.connectors.models import TextSection
+from onyx.connectors.onyx_jira.connector import _fetch_jira_issues_for_projects
+from onyx.connectors.onyx_jira.connector import _JIRA_MAX_PARALLEL_PROJECTS
+from onyx.connectors.onyx_jira.connector import _JIRA_TRANSFORM_WORKERS
+from onyx.connectors.onyx_jira.connector import _paginate_jql_search
+from onyx.connectors.onyx_jira.connector import JiraConnector
+
+
+def _make_client(pages: list[dict], deployment_type: str = "Cloud") -> MagicMock:
+    client = MagicMock()
+    client.deploymentType = deployment_type
+    client._options = {"server": "https://example.atlassian.net"}
+    client._get_url.side_effect = (
+        lambda path: f"https://example.atlassian.net/rest/api/2/{path}"
+    )
+    responses = []
+    for page in pages:
+        response = MagicMock()
+        response.content = orjson.dumps(page)
+        responses.append(response)
+    client._session.post.side_effect = responses
+    return client
+
+
+def test_cloud_pagination_follows_next_page_token() -> None:
+    client = _make_client(
+        [
+            {"issues": [{"key": "TEST-1"}, {"key": "TEST-2"}], "nextPageToken": "abc"},
+            {"issues": [{"key": "TEST-3"}]},
+        ]
+    )
+
+    issues = list(_paginate_jql_search(client, "project = TEST", 2, fields="key"))
+
+    assert [issue.raw["key"] for issue in issues] == ["TEST-1", "TEST-2", "TEST-3"]
+    assert client._session.post.call_count == 2
+    first_body = client._session.post.call_args_list[0].kwargs["json"]
+    second_body = client._session.post.call_args_list[1].kwargs["json"]
+    assert first_body["fields"] == ["key"]
+    assert "nextPageToken" not in first_body
+    assert second_body["nextPageToken"] == "abc"
+    client.search_issues.assert_not_called()
+
+
+def test_cloud_pagination_rejects_empty_jql() -> None:
+    client = _make_client([])
+
+    with pytest.raises(ValueError):
+        list(_paginate_jql_search(client, "", 2))
+
+    client._session.post.assert_not_called()
+
+
+def test_cloud_slim_documents_without_project_search_per_project() -> None:
+    client = _make_client(
+        [
+            {"issues": [{"key": "A-1", "fields": {}}]},
+            {"issues": [{"key": "B-1", "fields": {}}]},
+        ]
+    )
+    client.projects.return_value = [MagicMock(key="A"), MagicMock(key="B")]
+    connector = JiraConnector(jira_base_url="https://example.atlassian.net")
+    connector._jira_client = client
+
+    slim_docs = [
+        doc for batch in connector.retrieve_all_slim_documents() for doc in batch
+    ]
+
+    assert len(slim_docs) == 2
+    sent_jqls = [
+        call.kwargs["json"]["jql"] for call in client._session.post.call_args_list
+    ]
+    assert sent_jqls == ['project = "A"', 'project = "B"']
+
+
+def test_only_full_indexing_uses_cached_project_keys() -> None:
+    client = _make_client([{"issues": [{"key": "NEW-1", "fields": {}}]}])
+    client.projects.return_value = [MagicMock(key="NEW")]
+    connector = JiraConnector(jira_base_url="https://example.atlassian.net")
+    connector._jira_client = client
+    connector._cache_key = "cache-key"
+
+    with patch.dict(
+        "onyx.connectors.onyx_jira.utils._project_keys_cache",
+        {"cache-key": (time.monotonic(), ["OLD"])},
+        clear=True,
+    ):
+        assert connector._get_per_project_jql_queries(use_cache=True) == [
+            'project = "OLD"'
+        ]
+        client.projects.assert_not_called()
+
+        # slim documents drive pruning, so they must not use a stale project list
+        list(connector.retrieve_all_slim_documents())
+
+    client.projects.assert_called_once()
+    assert client._session.post.call_args.kwargs["json"]["jql"] == 'project = "NEW"'
+
+
+def test_server_slim_documents_without_project_use_single_query() -> None:
+    client = _make_client([{"issues": [], "total": 0}], deployment_type="Server")
+    connector = JiraConnector(jira_base_url="https://jira.example.com")
+    connector._jira_client = client
+
+    list(connector.retrieve_all_slim_documents())
+
+    client.projects.assert_not_called()
+    client._session.post.assert_called_once()
+    assert client._session.post.call_args.kwargs["json"]["jql"] == ""
+
+
+def test_server_pagination_posts_and_advances_by_returned_issues() -> None:
+    client = _make_client(
+        [
+            # the server may cap maxResults below what was requested
+            {"issues": [{"key": "TEST-1"}, {"key": "TEST-2"}], "total": 3},
+            {"issues": [{"key": "TEST-3"}], "total": 3},
+        ],
+        deployment_type="Server",
+    )
+
+    issues = list(_paginate_jql_search(client, "project = TEST", 5, fields="key"))
+
+    assert [issue.key for issue in issues] == ["TEST-1", "TEST-2", "TEST-3"]
+    first_call, second_call = client._session.post.call_args_list
+    assert first_call.args[0] == "https://example.atlassian.net/rest/api/2/search"
+    assert first_call.kwargs["json"] == {
+        "jql": "project = TEST",
+        "startAt": 0,
+        "maxResults": 5,
+        "fields": ["key"],
+    }
+    assert second_call.kwargs["json"]["startAt"] == 2
+    client.search_issues.assert_not_called()
+
+
+def test_deployment_type_is_only_fetched_once() -> None:
+    client = _make_client(
+        [{"issues": [], "total": 0}, {"issues": [], "total": 0}],
+        deployment_type="Server",
+    )
+    client.deploymentType = None
+    client.server_info.return_value = {"deploymentType": "Server"}
+
+    list(_paginate_jql_search(client, "project = A", 2))
+    list(_paginate_jql_search(client, "project = B", 2))
+
+    client.server_info.assert_called_once()
+    assert client.deploymentType == "Server"
+
+
+def _make_document(doc_id: str) -> Document:
+    return Document(
+        id=doc_id,
+        sections=[TextSection(link=doc_id, text=doc_id)],
+        source=DocumentSource.JIRA,
+        semantic_identifier=doc_id,
+        metadata={},
+    )
+
+
+def test_fetch_jira_issues_for_projects_yields_all_projects() -> None:
+    def _fake_fetch(jql: str, **kwargs: Any) -> Iterator[Document]:
+        yield from [_make_document(f"{jql}-1"), _make_document(f"{jql}-2")]
+
+    with patch(
+        "onyx.connectors.onyx_jira.connector.fetch_jira_issues_batch",
+        side_effect=_fake_fetch,
+    ):
+        docs = list(
+            _fetch_jira_issues_for_projects(
+                jira_client=MagicMock(),
+                jqls=["A", "B", "C"],
+                batch_size=1,
+            )
+        )
+
+    assert sorted(doc.id for doc in docs) == ["A-1", "A-2", "B-1", "B-2", "C-1", "C-2"]
+
+
+def test_fetch_jira_issues_for_projects_splits_transform_workers() -> None:
+    fake_fetch = MagicMock(return_value=iter([]))
+
+    with patch(
+        "onyx.connectors.onyx_jira.connector.fetch_jira_issues_batch", fake_fetch
+    ):
+        list(
+            _fetch_jira_issues_for_projects(
+                jira_client=MagicMock(),
+                jqls=["A", "B", "C", "D", "E"],
+                batch_size=1,
+            )
+        )
+
+    transform_workers = {
+        call.kwargs["transform_workers"] for call in fake_fetch.call_args_list
+    }
+    assert transform_workers == {_JIRA_TRANSFORM_WORKERS // _JIRA_MAX_PARALLEL_PROJECTS}
+
+
+def test_fetch_jira_issues_for_projects_propagates_errors() -> None:
+    def _failing_fetch(jql: str, **kwargs: Any) -> Iterator[Document]:
+        raise ValueError(jql)
+        yield
+
+    with patch(
+        "onyx.connectors.onyx_jira.connector.fetch_jira_issues_batch",
+        side_effect=_failing_fetch,
+    ):
+        with pytest.raises(ValueError):
+            list(
+                _fetch_jira_issues_for_projects(
+                    jira_client=MagicMock(),
+                    jqls=["A"],
+                    batch_size=1,
+                )
+            )
@@ -0,0 +1,81 @@
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from onyx.connectors.onyx_jira.utils import extract_text_from_adf
+from onyx.connectors.onyx_jira.utils import get_comment_strs
+from onyx.connectors.onyx_jira.utils import get_project_keys_cached
+
+
+def test_extract_text_from_adf_none() -> None:
+    assert extract_text_from_adf(None) == ""
+
+
+def test_extract_text_from_adf_preserves_document_order() -> None:
+    adf = {
+        "type": "doc",
+        "version": 1,
+        "content": [
+            {
+                "type": "paragraph",
+                "content": [{"type": "text", "text": "First"}],
+            },
+            {
+                "type": "bulletList",
+                "content": [
+                    {
+                        "type": "listItem",
+                        "content": [
+                            {
+                                "type": "paragraph",
+                                "content": [{"type": "text", "text": "Nested"}],
+                            }
+                        ],
+                    }
+                ],
+            },
+            {
+                "type": "paragraph",
+                "content": [
+                    {"type": "text", "text": "Last"},
+                    {"type": "hardBreak"},
+                ],
+            },
+        ],
+    }
+
+    assert extract_text_from_adf(adf) == "First Nested Last"
+
+
+def test_get_comment_strs_skips_blacklisted_authors() -> None:
+    issue = MagicMock()
+    issue.fields.comment.comments = [
+        MagicMock(body="keep me", author=MagicMock(emailAddress="a@example.com")),
+        MagicMock(body="skip me", author=MagicMock(emailAddress="Bot@Example.com")),
+    ]
+
+    with patch("onyx.connectors.onyx_jira.utils.JIRA_API_VERSION", "2"):
+        comments = get_comment_strs(issue, frozenset({"bot@example.com"}))
+
+    assert comments == ["keep me"]
+
+
+def test_get_comment_strs_keeps_comments_without_author_email() -> None:
+    issue = MagicMock()
+    issue.fields.comment.comments = [
+        MagicMock(body="no email", author=MagicMock(emailAddress=None)),
+    ]
+
+    with patch("onyx.connectors.onyx_jira.utils.JIRA_API_VERSION", "2"):
+        assert get_comment_strs(issue, frozenset({"bot@example.com"})) == ["no email"]
+        assert get_comment_strs(issue) == ["no email"]
+
+
+def test_get_project_keys_cached_reuses_recent_results() -> None:
+    jira_client = MagicMock()
+    jira_client.projects.return_value = [MagicMock(key="A"), MagicMock(key="B")]
+
+    with patch.dict("onyx.connectors.onyx_jira.utils._project_keys_cache", clear=True):
+        assert get_project_keys_cached(jira_client, "cache-key") == ["A", "B"]
+        assert get_project_keys_cached(jira_client, "cache-key") == ["A", "B"]
+
+    jira_client.projects.assert_called_once()
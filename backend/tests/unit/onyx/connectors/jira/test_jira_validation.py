@@ -0,0 +1,71 @@
+from unittest.mock import create_autospec
+from unittest.mock import MagicMock
+
+import pytest
+from jira import JIRA
+from jira.exceptions import JIRAError
+
+from onyx.connectors.exceptions import ConnectorValidationError
+from onyx.connectors.exceptions import CredentialExpiredError
+from onyx.connectors.exceptions import InsufficientPermissionsError
+from onyx.connectors.onyx_jira.connector import JiraConnector
+
+
+def _make_connector(project_key: str | None) -> tuple[JiraConnector, MagicMock]:
+    jira_client: MagicMock = create_autospec(JIRA, instance=True)
+    connector = JiraConnector(
+        jira_base_url="https://jira.example.com", project_key=project_key
+    )
+    connector._jira_client = jira_client
+    return connector, jira_client
+
+
+@pytest.mark.parametrize(
+    "project_key, status_code, expected_exception",
+    [
+        ("TEST", 401, CredentialExpiredError),
+        ("TEST", 403, InsufficientPermissionsError),
+        ("TEST", 404, ConnectorValidationError),
+        ("TEST", 429, ConnectorValidationError),
+        ("TEST", 500, RuntimeError),
+        (None, 401, CredentialExpiredError),
+        (None, 403, InsufficientPermissionsError),
+        # without a project there is nothing to be "not found"
+        (None, 404, RuntimeError),
+        (None, 429, ConnectorValidationError),
+        (None, 500, RuntimeError),
+    ],
+)
+def test_validate_connector_settings_maps_status_codes(
+    project_key: str | None,
+    status_code: int,
+    expected_exception: type[Exception],
+) -> None:
+    connector, jira_client = _make_connector(project_key)
+    error = JIRAError(status_code=status_code)
+    if project_key:
+        jira_client.project.side_effect = error
+    else:
+        jira_client.myself.side_effect = error
+
+    with pytest.raises(expected_exception):
+        connector.validate_connector_settings()
+
+
+def test_validate_connector_settings_with_project_checks_project() -> None:
+    connector, jira_client = _make_connector("TEST")
+
+    connector.validate_connector_settings()
+
+    jira_client.project.assert_called_once_with("TEST")
+    jira_client.myself.assert_not_called()
+    jira_client.projects.assert_not_called()
+
+
+def test_validate_connector_settings_without_project_uses_myself() -> None:
+    connector, jira_client = _make_connector(None)
+
+    connector.validate_connector_settings()
+
+    jira_client.myself.assert_called_once()
+    jira_client.projects.assert_not_called()
@@ -7,6 +7,7 @@ import pytest
 from jira.resources import Issue
 from pytest_mock import MockFixture
 
+from onyx.connectors.onyx_jira.connector import _issue_to_document
 from onyx.connectors.onyx_jira.connector import fetch_jira_issues_batch
 
 
@@ -15,6 +16,14 @@ def mock_jira_client() -> MagicMock:
     return MagicMock()
 
 
+@pytest.fixture
+def mock_search_pages() -> Generator[MagicMock, None, None]:
+    with patch(
+        "onyx.connectors.onyx_jira.connector._paginate_jql_search_pages"
+    ) as mock_pages:
+        yield mock_pages
+
+
 @pytest.fixture
 def mock_issue_small() -> MagicMock:
     issue = MagicMock(spec=Issue)
@@ -74,10 +83,11 @@ def patched_environment(
 
 def test_fetch_jira_issues_batch_small_ticket(
     mock_jira_client: MagicMock,
+    mock_search_pages: MagicMock,
     mock_issue_small: MagicMock,
     patched_environment: MockFixture,
 ) -> None:
-    mock_jira_client.search_issues.return_value = [mock_issue_small]
+    mock_search_pages.return_value = [[mock_issue_small]]
 
     docs = list(fetch_jira_issues_batch(mock_jira_client, "project = TEST", 50))
 
@@ -91,10 +101,11 @@ def test_fetch_jira_issues_batch_small_ticket(
 
 def test_fetch_jira_issues_batch_large_ticket(
     mock_jira_client: MagicMock,
+    mock_search_pages: MagicMock,
     mock_issue_large: MagicMock,
     patched_environment: MockFixture,
 ) -> None:
-    mock_jira_client.search_issues.return_value = [mock_issue_large]
+    mock_search_pages.return_value = [[mock_issue_large]]
 
     docs = list(fetch_jira_issues_batch(mock_jira_client, "project = TEST", 50))
 
@@ -103,11 +114,12 @@ def test_fetch_jira_issues_batch_large_ticket(
 
 def test_fetch_jira_issues_batch_mixed_tickets(
     mock_jira_client: MagicMock,
+    mock_search_pages: MagicMock,
     mock_issue_small: MagicMock,
     mock_issue_large: MagicMock,
     patched_environment: MockFixture,
 ) -> None:
-    mock_jira_client.search_issues.return_value = [mock_issue_small, mock_issue_large]
+    mock_search_pages.return_value = [[mock_issue_small, mock_issue_large]]
 
     docs = list(fetch_jira_issues_batch(mock_jira_client, "project = TEST", 50))
 
@@ -118,12 +130,68 @@ def test_fetch_jira_issues_batch_mixed_tickets(
 @patch("onyx.connectors.onyx_jira.connector.JIRA_CONNECTOR_MAX_TICKET_SIZE", 50)
 def test_fetch_jira_issues_batch_custom_size_limit(
     mock_jira_client: MagicMock,
+    mock_search_pages: MagicMock,
     mock_issue_small: MagicMock,
     mock_issue_large: MagicMock,
     patched_environment: MockFixture,
 ) -> None:
-    mock_jira_client.search_issues.return_value = [mock_issue_small, mock_issue_large]
+    mock_search_pages.return_value = [[mock_issue_small, mock_issue_large]]
 
     docs = list(fetch_jira_issues_batch(mock_jira_client, "project = TEST", 50))
 
     assert len(docs) == 0  # Both tickets should be skipped due to the low size limit
+
+
+def test_fetch_jira_issues_batch_requests_explicit_fields(
+    mock_jira_client: MagicMock,
+    mock_search_pages: MagicMock,
+    mock_issue_small: MagicMock,
+    patched_environment: MockFixture,
+) -> None:
+    mock_search_pages.return_value = [[mock_issue_small]]
+
+    list(fetch_jira_issues_batch(mock_jira_client, "project = TEST", 50))
+
+    fields = mock_search_pages.call_args.kwargs["fields"]
+    assert fields is not None
+    assert set(fields.split(",")) >= {"summary", "description", "comment", "updated"}
+
+
+def test_issue_to_document_sets_primary_owners_from_raw_fields(
+    patched_environment: MockFixture,
+) -> None:
+    issue = Issue(
+        {"server": "https://example.atlassian.net"},
+        MagicMock(),
+        raw={
+            "key": "RAW-1",
+            "fields": {
+                "summary": "Raw Issue",
+                "description": "Raw description",
+                "updated": "2023-01-01T00:00:00.000+0000",
+                "labels": ["backend"],
+                "comment": {"comments": []},
+                "creator": {
+                    "displayName": "John Doe",
+                    "emailAddress": "john@example.com",
+                },
+                "assignee": {
+                    "displayName": "Jane Doe",
+                    "emailAddress": "jane@example.com",
+                },
+                "priority": {"name": "High"},
+                "status": {"name": "Open"},
+                "resolution": None,
+            },
+        },
+    )
+
+    doc = _issue_to_document(issue, base_url="https://example.atlassian.net")
+
+    assert doc is not None
+    assert doc.primary_owners is not None
+    assert {owner.email for owner in doc.primary_owners} == {
+        "john@example.com",
+        "jane@example.com",
+    }
+    assert doc.metadata == {"priority": "High", "status": "Open", "label": ["backend"]}